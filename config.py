@@ -2,75 +2,200 @@
 Configuration management for the notification forwarder
 """
 import os
+import sys
 import logging
-from typing import List, Optional
-from dotenv import load_dotenv
+from functools import lru_cache
+from typing import Callable, Dict, FrozenSet, List, Optional, Tuple
 
 
-class Config:
-    """Application configuration"""
+def _parse_enabled(value: str) -> bool:
+    """
+    Parse an ENABLE_<PROVIDER> flag
 
-    def __init__(self):
-        """Load configuration from environment variables"""
-        # Load .env file if it exists
-        load_dotenv()
+    Args:
+        value: Raw environment value
 
-        self.logger = logging.getLogger(__name__)
+    Returns:
+        True if provider should be enabled
+    """
+    value = value.lower()
 
-        # ======================
-        # Provider Configurations
-        # ======================
+    # If not explicitly set, we'll check for credentials later
+    if not value:
+        return True  # Default to enabled if not specified
+
+    return value in ('true', '1', 'yes', 'on')
+
+
+def _parse_app_list(value: str) -> List[str]:
+    """Parse a comma-separated list of app names (one strip per token)"""
+    return [app for app in (token.strip() for token in value.split(",")) if app]
+
+
+# (attribute, environment variable, default, parser)
+_ENV_FIELDS: Tuple[Tuple[str, str, str, Callable[[str], object]], ...] = (
+    # FCM Configuration
+    ("fcm_enabled", "ENABLE_FCM", "", _parse_enabled),
+    ("fcm_service_account_file", "FCM_SERVICE_ACCOUNT_FILE", "service-account.json", str),
+    ("fcm_topic", "FCM_TOPIC", "windows_notifications", str),
 
-        # FCM Configuration
-        self.fcm_enabled: bool = self._is_provider_enabled("FCM")
-        self.fcm_service_account_file: str = os.getenv("FCM_SERVICE_ACCOUNT_FILE", "service-account.json")
-        self.fcm_topic: str = os.getenv("FCM_TOPIC", "windows_notifications")
+    # Pushbullet Configuration
+    ("pushbullet_enabled", "ENABLE_PUSHBULLET", "", _parse_enabled),
+    ("pushbullet_api_token", "PUSHBULLET_API_TOKEN", "", str),
 
-        # Pushbullet Configuration
-        self.pushbullet_enabled: bool = self._is_provider_enabled("PUSHBULLET")
-        self.pushbullet_api_token: str = os.getenv("PUSHBULLET_API_TOKEN", "")
+    # Ntfy Configuration
+    ("ntfy_enabled", "ENABLE_NTFY", "", _parse_enabled),
+    ("ntfy_server_url", "NTFY_SERVER_URL", "https://ntfy.sh", str),
+    ("ntfy_topic", "NTFY_TOPIC", "windows_notifications", str),
+    ("ntfy_username", "NTFY_USERNAME", "", str),
+    ("ntfy_password", "NTFY_PASSWORD", "", str),
 
-        # Ntfy Configuration
-        self.ntfy_enabled: bool = self._is_provider_enabled("NTFY")
-        self.ntfy_server_url: str = os.getenv("NTFY_SERVER_URL", "https://ntfy.sh")
-        self.ntfy_topic: str = os.getenv("NTFY_TOPIC", "windows_notifications")
-        self.ntfy_username: str = os.getenv("NTFY_USERNAME", "")
-        self.ntfy_password: str = os.getenv("NTFY_PASSWORD", "")
+    # App Filtering
+    ("ignored_apps", "IGNORED_APPS", "", _parse_app_list),
+    ("whitelist_apps", "WHITELIST_APPS", "", _parse_app_list),
+)
 
-        # ======================
-        # App Filtering
-        # ======================
-        ignored_apps = os.getenv("IGNORED_APPS", "")
-        self.ignored_apps: List[str] = [app.strip() for app in ignored_apps.split(",") if app.strip()]
 
-        whitelist_apps = os.getenv("WHITELIST_APPS", "")
-        self.whitelist_apps: List[str] = [app.strip() for app in whitelist_apps.split(",") if app.strip()]
+# Environment variable prefixes that indicate any provider is configured
+_PROVIDER_ENV_PREFIXES = ("ENABLE_", "FCM_", "PUSHBULLET_", "NTFY_")
 
-    def _is_provider_enabled(self, provider: str) -> bool:
-        """
-        Check if a provider is enabled via environment variable
+# (provider name, enabled attribute, validator method)
+PROVIDERS: Tuple[Tuple[str, str, str], ...] = (
+    ("FCM", "fcm_enabled", "validate_fcm"),
+    ("Pushbullet", "pushbullet_enabled", "validate_pushbullet"),
+    ("Ntfy", "ntfy_enabled", "validate_ntfy"),
+)
 
-        Args:
-            provider: Provider name (FCM, PUSHBULLET, NTFY)
 
-        Returns:
-            True if provider should be enabled
-        """
-        env_key = f"ENABLE_{provider}"
-        env_value = os.getenv(env_key, "").lower()
+# Values applied from the compiled configuration or the .env file, so a
+# later .env parse can replace them
+_applied_env: Dict[str, str] = {}
+
+
+@lru_cache(maxsize=1)
+def load_compiled_env() -> bool:
+    """
+    Apply .env values compiled into a frozen executable (see tools/compile_env.py)
+
+    Variables already set in the environment take precedence; a .env file
+    next to the executable is applied on top (see _load_env_file()).
+
+    Returns:
+        True if running frozen and compiled values were applied
+    """
+    if not getattr(sys, 'frozen', False):
+        return False
+
+    try:
+        from compiled_env import ENV
+    except ImportError:
+        return False
+
+    for key, value in ENV.items():
+        if key not in os.environ:
+            os.environ[key] = value
+            _applied_env[key] = value
+    return True
+
 
-        # If not explicitly set, we'll check for credentials later
-        if not env_value:
-            return True  # Default to enabled if not specified
+@lru_cache(maxsize=1)
+def _load_env_file_cached(path: str, mtime: float) -> None:
+    """
+    Parse the .env file into os.environ; cached per (path, mtime)
 
-        return env_value in ('true', '1', 'yes', 'on')
+    Variables already set in the environment take precedence, except ones
+    applied by the compiled configuration or an earlier parse, which are
+    replaced so .env overrides and edits take effect.
+    """
+    from dotenv import dotenv_values
+    for key, value in dotenv_values(path).items():
+        if value is None:
+            continue
+        if key not in os.environ or os.environ[key] == _applied_env.get(key):
+            os.environ[key] = value
+            _applied_env[key] = value
+
+
+def _load_env_file() -> None:
+    """Load the .env file into os.environ, skipping the parse if it is unchanged"""
+    if load_compiled_env():
+        # Compiled configuration: only a .env next to the executable is read,
+        # overriding the compiled values
+        path = os.path.join(os.path.dirname(sys.executable), ".env")
+    else:
+        from dotenv import find_dotenv
+        path = find_dotenv()
+        if not path:
+            return
+
+    try:
+        mtime = os.stat(path).st_mtime
+    except OSError:
+        return
+
+    _load_env_file_cached(path, mtime)
+
+
+class Config:
+    """Application configuration"""
+
+    # Provider Configurations
+    fcm_enabled: bool
+    fcm_service_account_file: str
+    fcm_topic: str
+    pushbullet_enabled: bool
+    pushbullet_api_token: str
+    ntfy_enabled: bool
+    ntfy_server_url: str
+    ntfy_topic: str
+    ntfy_username: str
+    ntfy_password: str
+
+    # App Filtering
+    ignored_apps: List[str]
+    whitelist_apps: List[str]
+
+    def __init__(self):
+        """Load configuration from environment variables"""
+        # Load .env file if it exists
+        _load_env_file()
+
+        self.logger = logging.getLogger(__name__)
+
+        # Snapshot the environment once and assign every field in a single pass
+        env = os.environ.copy()
+        for attr, env_key, default, parse in _ENV_FIELDS:
+            setattr(self, attr, parse(env.get(env_key, default)))
+
+        # No provider settings at all: validate() can fail fast
+        self._empty = not any(key.startswith(_PROVIDER_ENV_PREFIXES) for key in env)
+
+        # Sets for O(1) membership checks on the notification path
+        # (the lists are kept for display only)
+        self._ignored_set: FrozenSet[str] = frozenset(self.ignored_apps)
+        self._whitelist_set: FrozenSet[str] = frozenset(self.whitelist_apps)
+
+        # Cached os.stat() results for validated file paths
+        self._file_exists_cache: Dict[str, bool] = {}
+
+    def _file_exists(self, path: str) -> bool:
+        """Check whether a file exists, caching the result"""
+        exists = self._file_exists_cache.get(path)
+        if exists is None:
+            try:
+                os.stat(path)
+                exists = True
+            except OSError:
+                exists = False
+            self._file_exists_cache[path] = exists
+        return exists
 
     def validate_fcm(self) -> bool:
         """Validate FCM configuration"""
         if not self.fcm_enabled:
             return True  # Skip validation if disabled
 
-        if not os.path.exists(self.fcm_service_account_file):
+        if not self._file_exists(self.fcm_service_account_file):
             self.logger.warning(f"⚠️  FCM disabled: Service account file not found: {self.fcm_service_account_file}")
             self.fcm_enabled = False
             return False
@@ -108,18 +233,15 @@ class Config:
         Returns:
             True if at least one provider is valid
         """
-        self.validate_fcm()
-        self.validate_pushbullet()
-        self.validate_ntfy()
+        if self._empty:
+            self.logger.error("❌ No notification provider settings found. Please configure at least one provider in .env file")
+            return False
 
-        # Check if at least one provider is enabled
-        enabled_count = sum([
-            self.fcm_enabled,
-            self.pushbullet_enabled,
-            self.ntfy_enabled
-        ])
+        for _, _, validator in PROVIDERS:
+            getattr(self, validator)()
 
-        if enabled_count == 0:
+        # Check if at least one provider is enabled
+        if not self.get_enabled_providers():
             self.logger.error("❌ No notification providers enabled!")
             self.logger.error("Please configure at least one provider in .env file")
             return False
@@ -137,26 +259,19 @@ class Config:
             True if notification should be forwarded, False otherwise
         """
         # If whitelist is defined, only forward apps in whitelist
-        if self.whitelist_apps:
-            return app_name in self.whitelist_apps
+        if self._whitelist_set:
+            return app_name in self._whitelist_set
 
         # If no whitelist, forward all except ignored apps
-        if self.ignored_apps:
-            return app_name not in self.ignored_apps
+        if self._ignored_set:
+            return app_name not in self._ignored_set
 
         # If no filters defined, forward everything
         return True
 
     def get_enabled_providers(self) -> List[str]:
         """Get list of enabled provider names"""
-        providers = []
-        if self.fcm_enabled:
-            providers.append("FCM")
-        if self.pushbullet_enabled:
-            providers.append("Pushbullet")
-        if self.ntfy_enabled:
-            providers.append("Ntfy")
-        return providers
+        return [name for name, enabled_attr, _ in PROVIDERS if getattr(self, enabled_attr)]
 
     def __repr__(self) -> str:
         """String representation of config"""
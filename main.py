@@ -3,13 +3,17 @@ Windows Notification Forwarder
 Forwards Windows notifications to multiple channels (FCM, Pushbullet, Ntfy)
 """
 import asyncio
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
+from typing import Callable, Dict
 
-from config import Config
+from config import Config, load_compiled_env
 from notification_listener import WindowsNotificationListener
-from providers import ProviderManager, FCMProvider, PushbulletProvider, NtfyProvider
+from providers import BaseProvider, ProviderManager, FCMProvider, PushbulletProvider, NtfyProvider
 
 
 def setup_logging():
@@ -26,19 +30,65 @@ def setup_logging():
     file_handler.setLevel(logging.INFO)
     file_handler.setFormatter(logging.Formatter(log_format))
 
+    # Route records through a queue so callers never block on console/disk I/O;
+    # a background listener thread writes them to the real handlers
+    log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+    queue_listener = QueueListener(log_queue, console_handler, file_handler, respect_handler_level=True)
+    queue_listener.start()
+    atexit.register(queue_listener.stop)
+
+    # The queue handler only renders the message; the real handlers apply log_format
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
+
     # Configure root logger
     logging.basicConfig(
         level=logging.INFO,
-        format=log_format,
-        handlers=[console_handler, file_handler]
+        handlers=[queue_handler]
     )
 
+    # httpx logs every request at INFO; keep only its warnings
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
     # Ensure stdout uses UTF-8 on Windows
     if sys.platform == 'win32':
         import io
         sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
 
 
+def _create_fcm_provider(config: Config) -> FCMProvider:
+    """Create the FCM provider from configuration"""
+    return FCMProvider(
+        service_account_file=config.fcm_service_account_file,
+        topic=config.fcm_topic
+    )
+
+
+def _create_pushbullet_provider(config: Config) -> PushbulletProvider:
+    """Create the Pushbullet provider from configuration"""
+    return PushbulletProvider(
+        api_token=config.pushbullet_api_token
+    )
+
+
+def _create_ntfy_provider(config: Config) -> NtfyProvider:
+    """Create the Ntfy provider from configuration"""
+    return NtfyProvider(
+        server_url=config.ntfy_server_url,
+        topic=config.ntfy_topic,
+        username=config.ntfy_username or None,
+        password=config.ntfy_password or None
+    )
+
+
+# Provider factories keyed by the names in config.PROVIDERS
+PROVIDER_FACTORIES: Dict[str, Callable[[Config], BaseProvider]] = {
+    "FCM": _create_fcm_provider,
+    "Pushbullet": _create_pushbullet_provider,
+    "Ntfy": _create_ntfy_provider,
+}
+
+
 class NotificationForwarder:
     """Main application class that coordinates notification listening and forwarding"""
 
@@ -64,30 +114,9 @@ class NotificationForwarder:
             # Initialize providers
             self.logger.info("Initializing notification providers...")
 
-            # Add FCM provider if enabled
-            if self.config.fcm_enabled:
-                fcm = FCMProvider(
-                    service_account_file=self.config.fcm_service_account_file,
-                    topic=self.config.fcm_topic
-                )
-                self.provider_manager.add_provider(fcm)
-
-            # Add Pushbullet provider if enabled
-            if self.config.pushbullet_enabled:
-                pushbullet = PushbulletProvider(
-                    api_token=self.config.pushbullet_api_token
-                )
-                self.provider_manager.add_provider(pushbullet)
-
-            # Add Ntfy provider if enabled
-            if self.config.ntfy_enabled:
-                ntfy = NtfyProvider(
-                    server_url=self.config.ntfy_server_url,
-                    topic=self.config.ntfy_topic,
-                    username=self.config.ntfy_username if self.config.ntfy_username else None,
-                    password=self.config.ntfy_password if self.config.ntfy_password else None
-                )
-                self.provider_manager.add_provider(ntfy)
+            # Add each enabled provider
+            for name in self.config.get_enabled_providers():
+                self.provider_manager.add_provider(PROVIDER_FACTORIES[name](self.config))
 
             # Check if any providers are enabled
             provider_count = self.provider_manager.get_provider_count()
@@ -158,6 +187,7 @@ class NotificationForwarder:
         self.logger.info("Shutting down...")
         if self.listener:
             await self.listener.stop_listening()
+        self.provider_manager.close()
         self.logger.info("Shutdown complete")
 
 
@@ -180,15 +210,19 @@ async def main():
     logging.info(f"Current working directory: {Path.cwd()}")
     logging.info(f"App directory: {app_dir}")
 
-    if not env_file.exists():
+    if load_compiled_env():
+        logging.info("Using configuration compiled into the executable")
+        if env_file.exists():
+            logging.info(f"Applying overrides from .env file at: {env_file}")
+    elif not env_file.exists():
         logging.error(
             f"No .env file found at {env_file}!"
         )
         logging.error("Please copy .env.example to .env and configure it in the same folder as the executable.")
         input("\nPress Enter to exit...")
         return
-
-    logging.info(f"Found .env file at: {env_file}")
+    else:
+        logging.info(f"Found .env file at: {env_file}")
 
     # Change to app directory so dotenv can find .env
     import os
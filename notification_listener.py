@@ -4,10 +4,17 @@ Captures all Windows 10/11 toast notifications from any app
 """
 import asyncio
 import logging
+from collections import OrderedDict
 from typing import Callable, Optional
 from winrt.windows.ui.notifications.management import UserNotificationListener, UserNotificationListenerAccessStatus
 from winrt.windows.ui.notifications import NotificationKinds
 
+# Maximum number of processed notification IDs remembered for de-duplication
+_SEEN_MAX = 4096
+
+# Resolved once instead of on every poll
+_TOAST_KIND = NotificationKinds.TOAST
+
 
 class WindowsNotificationListener:
     """Listens to Windows notifications and triggers a callback"""
@@ -24,8 +31,14 @@ class WindowsNotificationListener:
         self.listener: Optional[UserNotificationListener] = None
         self.logger = logging.getLogger(__name__)
         self.event_token = None
-        self.seen_notification_ids = set()  # Track processed notifications
-        self.poll_interval = 0.5  # Poll every 0.5 seconds
+        self._seen: "OrderedDict[int, None]" = OrderedDict()  # Track processed notifications (bounded)
+        self.poll_interval = 0.5  # Base polling interval in seconds
+        self.min_poll_interval = 0.25  # Interval right after a new notification
+        self.max_poll_interval = 5.0  # Interval ceiling when idle
+        self._idle_polls = 0  # Consecutive polls without new notifications
+        self._event_mode = False  # True once the event-based listener is registered
+        self._stop_event = asyncio.Event()  # Set by stop_listening()
+        self._get_notifications = None  # Bound get_notifications_async, set by start_listening()
 
     async def request_access(self) -> bool:
         """
@@ -52,31 +65,65 @@ class WindowsNotificationListener:
             self.logger.error(f"Error requesting notification access: {e}")
             return False
 
-    async def _poll_notifications(self):
-        """Poll for new notifications periodically"""
+    def _mark_seen(self, notif_id):
+        """Remember a processed notification ID, evicting the oldest beyond _SEEN_MAX"""
+        self._seen[notif_id] = None
+        self._seen.move_to_end(notif_id)
+        while len(self._seen) > _SEEN_MAX:
+            self._seen.popitem(last=False)
+
+    def _next_poll_delay(self, new_count: int) -> float:
+        """
+        Compute the delay before the next poll
+
+        Polls quickly right after activity and backs off exponentially while idle.
+
+        Args:
+            new_count: Number of new notifications found by the last poll
+
+        Returns:
+            Delay in seconds
+        """
+        if new_count:
+            self._idle_polls = 0
+            return self.min_poll_interval
+
+        delay = min(self.max_poll_interval, self.poll_interval * (1.5 ** self._idle_polls))
+        if delay < self.max_poll_interval:
+            self._idle_polls += 1
+        return delay
+
+    async def _poll_notifications(self) -> int:
+        """
+        Poll for new notifications
+
+        Returns:
+            Number of new notifications processed
+        """
         try:
             # Get all current notifications
-            notifications = await self.listener.get_notifications_async(NotificationKinds.TOAST)
+            notifications = await self._get_notifications(_TOAST_KIND)
 
             if not notifications:
                 self.logger.debug("No notifications found in notification center")
-                return
+                return 0
 
-            self.logger.debug(f"Found {len(notifications)} notifications in notification center")
+            self.logger.debug("Found %d notifications in notification center", len(notifications))
 
-            # Process each notification
-            for notification in notifications:
-                try:
-                    # Get notification ID to track duplicates
-                    notif_id = notification.id
+            # Read each ID once and drop already-processed notifications before
+            # touching any of the (expensive) content properties
+            seen = self._seen
+            new_items = [(n, nid) for n, nid in ((n, n.id) for n in notifications) if nid not in seen]
 
-                    # Skip if we've already processed this notification
-                    if notif_id in self.seen_notification_ids:
-                        self.logger.debug(f"Skipping already seen notification ID: {notif_id}")
-                        continue
+            if not new_items:
+                self.logger.debug("No new notifications since last poll")
+                return 0
 
+            # Process each new notification
+            for notification, notif_id in new_items:
+                try:
                     # Mark as seen
-                    self.seen_notification_ids.add(notif_id)
+                    self._mark_seen(notif_id)
                     self.logger.info(f"Processing new notification ID: {notif_id}")
 
                     # Process the notification
@@ -86,56 +133,57 @@ class WindowsNotificationListener:
                     self.logger.error(f"Error processing individual notification: {e}", exc_info=True)
                     continue
 
+            return len(new_items)
+
         except Exception as e:
-            self.logger.debug(f"Error polling notifications: {e}")
+            self.logger.debug("Error polling notifications: %s", e)
+            return 0
 
     def _process_notification(self, notification):
         """Process and extract notification details"""
         try:
-            # Extract notification details
+            # Extract app name (app_info raises for some system notifications)
             app_name = "Unknown App"
             try:
-                app_info = notification.app_info
-                if app_info and hasattr(app_info, 'display_info') and app_info.display_info:
-                    app_name = app_info.display_info.display_name
+                display_info = getattr(notification.app_info, 'display_info', None)
+                if display_info:
+                    app_name = display_info.display_name or app_name
             except Exception as e:
-                self.logger.debug(f"Could not get app name: {e}")
+                self.logger.debug("Could not get app name: %s", e)
 
             # Get notification content
             notification_data = notification.notification
             if not notification_data:
                 return
 
-            # Extract visual content
+            # Extract visual content from the first binding that has text
             title = ""
             text = ""
-
             try:
-                visual = notification_data.visual
-                if visual and hasattr(visual, 'bindings') and visual.bindings:
-                    for binding in visual.bindings:
-                        try:
-                            text_elements = binding.get_text_elements()
-                            if text_elements and len(text_elements) > 0:
-                                # First element is usually the title
-                                if not title and len(text_elements) > 0:
-                                    title = text_elements[0].text or ""
-                                # Second element is usually the message body
-                                if not text and len(text_elements) > 1:
-                                    text = text_elements[1].text or ""
-                                break
-                        except Exception as e:
-                            self.logger.debug(f"Error getting text elements from binding: {e}")
-                            continue
+                visual = getattr(notification_data, 'visual', None)
+                for binding in getattr(visual, 'bindings', None) or ():
+                    try:
+                        elements = binding.get_text_elements()
+                        if elements:
+                            # First element is usually the title, second the message body
+                            title = elements[0].text or ""
+                            text = (elements[1].text or "") if len(elements) > 1 else ""
+                            break
+                    except Exception as e:
+                        self.logger.debug("Error getting text elements from binding: %s", e)
+                        title = ""
+                        text = ""
+                        continue
             except Exception as e:
-                self.logger.debug(f"Error extracting visual content: {e}")
+                self.logger.debug("Error extracting visual content: %s", e)
 
             # Build notification dict
+            creation_time = getattr(notification, 'creation_time', None)
             notification_dict = {
                 "app_name": app_name,
                 "title": title,
                 "text": text,
-                "timestamp": notification.creation_time.timestamp() if hasattr(notification, 'creation_time') and notification.creation_time else None
+                "timestamp": creation_time.timestamp() if creation_time else None
             }
 
             # Call the callback
@@ -146,27 +194,38 @@ class WindowsNotificationListener:
             self.logger.error(f"Error processing notification: {e}", exc_info=True)
 
     async def start_listening(self):
-        """Start listening for notifications using polling"""
+        """Start listening for notifications (event-based, falling back to polling)"""
         try:
             if not self.listener:
                 self.logger.error("Listener not initialized. Call request_access() first.")
                 return
 
-            self.logger.info("Started listening for notifications (polling mode)")
-            self.logger.info(f"Polling interval: {self.poll_interval} seconds")
-
             # Try to use event-based listener first, fall back to polling if it fails
             try:
                 self.event_token = self.listener.add_notification_changed(self._on_event_notification)
+                self._event_mode = True
                 self.logger.info("Using event-based notification listener")
             except Exception as e:
                 self.logger.warning(f"Event-based listener not available: {e}")
                 self.logger.info("Falling back to polling mode")
 
-            # Poll for notifications
-            while True:
-                await self._poll_notifications()
-                await asyncio.sleep(self.poll_interval)
+            if self._event_mode:
+                # Events deliver new notifications; no need to poll
+                self.logger.info("Started listening for notifications (event mode)")
+                await self._stop_event.wait()
+                return
+
+            self._get_notifications = self.listener.get_notifications_async
+
+            self.logger.info("Started listening for notifications (polling mode)")
+            self.logger.info(
+                f"Polling interval: {self.min_poll_interval}-{self.max_poll_interval} seconds (adaptive)"
+            )
+
+            # Poll for notifications, backing off while idle
+            while not self._stop_event.is_set():
+                new_count = await self._poll_notifications()
+                await asyncio.sleep(self._next_poll_delay(new_count))
 
         except Exception as e:
             self.logger.error(f"Error in notification listener: {e}", exc_info=True)
@@ -176,14 +235,15 @@ class WindowsNotificationListener:
         try:
             notification_id = args.user_notification_id
             notification = self.listener.get_notification(notification_id)
-            if notification and notification.id not in self.seen_notification_ids:
-                self.seen_notification_ids.add(notification.id)
+            if notification and notification.id not in self._seen:
+                self._mark_seen(notification.id)
                 self._process_notification(notification)
         except Exception as e:
-            self.logger.debug(f"Error in event notification handler: {e}")
+            self.logger.debug("Error in event notification handler: %s", e)
 
     async def stop_listening(self):
         """Stop listening for notifications"""
+        self._stop_event.set()
         try:
             if self.listener and self.event_token:
                 self.listener.remove_notification_changed(self.event_token)
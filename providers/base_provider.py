@@ -4,13 +4,39 @@ Abstract base class for all notification providers
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from functools import wraps
+from typing import Callable, Optional
 import logging
+import threading
+import time
+
+
+def record_send_result(send: Callable[..., bool]) -> Callable[..., bool]:
+    """
+    Decorate a provider send method to feed its result to the circuit breaker
+
+    The send always runs (an exception counts as failure); providers check
+    _circuit_is_open() when a notification is queued.
+    """
+    @wraps(send)
+    def wrapper(self: "BaseProvider", *args, **kwargs) -> bool:
+        success = False
+        try:
+            success = send(self, *args, **kwargs)
+            return success
+        finally:
+            self._record_result(success)
+    return wrapper
 
 
 class BaseProvider(ABC):
     """Abstract base class for notification providers"""
 
+    # Consecutive failed sends before the circuit opens
+    CIRCUIT_FAILURE_THRESHOLD = 5
+    # Seconds sends are skipped once the circuit is open
+    CIRCUIT_OPEN_SECONDS = 30.0
+
     def __init__(self, name: str):
         """
         Initialize the provider
@@ -22,6 +48,11 @@ class BaseProvider(ABC):
         self.logger = logging.getLogger(f"Provider.{name}")
         self.enabled = False
 
+        # Circuit breaker state (see record_send_result())
+        self._failure_count = 0
+        self._circuit_open_until = 0.0
+        self._circuit_lock = threading.Lock()
+
     @abstractmethod
     def initialize(self) -> bool:
         """
@@ -62,6 +93,40 @@ class BaseProvider(ABC):
         """
         pass
 
+    def close(self):
+        """Release provider resources (e.g. HTTP sessions)"""
+        pass
+
+    def _circuit_is_open(self) -> bool:
+        """Check if sends are currently being skipped after repeated failures"""
+        return time.monotonic() < self._circuit_open_until
+
+    def _record_result(self, success: bool):
+        """
+        Update the circuit breaker with the result of a send
+
+        Args:
+            success: Whether the send succeeded
+        """
+        with self._circuit_lock:
+            if success:
+                if self._failure_count >= self.CIRCUIT_FAILURE_THRESHOLD:
+                    self.logger.warning("🟢 %s circuit closed, sends resumed", self.name)
+                self._failure_count = 0
+                self._circuit_open_until = 0.0
+                return
+
+            self._failure_count += 1
+            if self._failure_count >= self.CIRCUIT_FAILURE_THRESHOLD:
+                was_open = self._circuit_is_open()
+                self._circuit_open_until = time.monotonic() + self.CIRCUIT_OPEN_SECONDS
+                if was_open:  # Queued sends failing while open just extend the window
+                    return
+                self.logger.warning(
+                    "🔴 %s circuit open after %d consecutive failures, skipping sends for %.0fs",
+                    self.name, self._failure_count, self.CIRCUIT_OPEN_SECONDS
+                )
+
     def is_enabled(self) -> bool:
         """Check if provider is enabled"""
         return self.enabled
@@ -4,9 +4,13 @@ Modern FCM HTTP v1 API with OAuth2 authentication
 """
 
 import os
-from typing import Optional
-from .base_provider import BaseProvider
+import queue
+import threading
+import requests
+from typing import Optional, Tuple
+from .base_provider import BaseProvider, record_send_result
 from utils.fcm_v1_helper import FCMv1Notifier
+from utils.http_session import create_session, warm_up
 
 
 class FCMProvider(BaseProvider):
@@ -24,6 +28,11 @@ class FCMProvider(BaseProvider):
         self.service_account_file = service_account_file
         self.topic = topic
         self.fcm = None
+        self.session: Optional[requests.Session] = None
+
+        # Sends are handed to a background worker so callers never block on HTTP
+        self._queue: "queue.Queue[Optional[Tuple[str, str, Optional[str]]]]" = queue.Queue()
+        self._worker_thread: Optional[threading.Thread] = None
 
     def initialize(self) -> bool:
         """Initialize FCM with service account"""
@@ -33,10 +42,23 @@ class FCMProvider(BaseProvider):
                 self.logger.error(f"Service account file not found: {self.service_account_file}")
                 return False
 
+            # Session for OAuth2 token refreshes (sends use the notifier's HTTP/2 client)
+            self.session = create_session(pool_connections=1, pool_maxsize=1)
+
             # Initialize FCM notifier
-            self.fcm = FCMv1Notifier(self.service_account_file)
+            self.fcm = FCMv1Notifier(self.service_account_file, session=self.session)
+
+            # Start the background send worker
+            self._worker_thread = threading.Thread(
+                target=self._worker,
+                name="FCMProvider-worker",
+                daemon=True
+            )
+            self._worker_thread.start()
+
             self.enabled = True
-            self.logger.info(f"✅ FCM initialized (topic: {self.topic})")
+            warm_up(self.fcm.client, self.fcm.fcm_url)
+            self.logger.info("✅ FCM initialized (topic: %s)", self.topic)
             return True
 
         except Exception as e:
@@ -65,10 +87,47 @@ class FCMProvider(BaseProvider):
         body: str,
         source_app: Optional[str] = None
     ) -> bool:
-        """Send notification via FCM"""
-        if not self.enabled or not self.fcm:
+        """
+        Queue notification for delivery via FCM
+
+        Returns immediately; the HTTP request is made by the background worker.
+        """
+        if not self.enabled or not self.fcm or self._circuit_is_open():
             return False
 
+        self._queue.put((title, body, source_app))
+        return True
+
+    def _worker(self):
+        """Background loop that delivers queued notifications"""
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:  # Stop sentinel from close()
+                    return
+                self._send_now(*item)
+            finally:
+                self._queue.task_done()
+
+    def close(self):
+        """Stop the send worker and close the HTTP client and session"""
+        self.enabled = False
+        if self._worker_thread and self._worker_thread.is_alive():
+            self._queue.put(None)
+            self._worker_thread.join(timeout=5)
+        if self.fcm:
+            self.fcm.close()
+        elif self.session:
+            self.session.close()
+
+    @record_send_result
+    def _send_now(
+        self,
+        title: str,
+        body: str,
+        source_app: Optional[str] = None
+    ) -> bool:
+        """Send notification via FCM (blocking)"""
         try:
             success = self.fcm.send_to_topic(
                 topic=self.topic,
@@ -79,7 +138,7 @@ class FCMProvider(BaseProvider):
             )
 
             if success:
-                self.logger.debug(f"✅ FCM: {title}")
+                self.logger.debug("✅ FCM: %s", title)
             else:
                 self.logger.warning(f"❌ FCM: Failed to send '{title}'")
 
@@ -3,9 +3,30 @@ Ntfy Provider
 Send notifications via ntfy.sh (or self-hosted ntfy server)
 """
 
+import queue
+import threading
 import requests
-from typing import Optional
-from .base_provider import BaseProvider
+from typing import Dict, Optional, Tuple
+from .base_provider import BaseProvider, record_send_result
+from utils.http_retry import send_with_retry
+from utils.http_session import create_session, warm_up
+
+
+# Tags header value per source app, built once per app
+_TAG_CACHE: Dict[str, str] = {}
+_TAG_CACHE_MAX = 1024
+
+
+def _app_tag(app: str) -> str:
+    """Get the Tags header value for a source app"""
+    tag = _TAG_CACHE.get(app)
+    if tag is None:
+        if len(_TAG_CACHE) >= _TAG_CACHE_MAX:
+            _TAG_CACHE.clear()
+        tag = f"computer,{app.lower().replace(' ', '_')}"
+        _TAG_CACHE[app] = tag
+    return tag
+
 
 class NtfyProvider(BaseProvider):
     """Ntfy notification provider"""
@@ -31,11 +52,35 @@ class NtfyProvider(BaseProvider):
         self.topic = topic
         self.endpoint = f"{self.server_url}/{self.topic}"
 
+        # Headers shared by every notification; Title/Tags are set per send
+        self._base_headers = {
+            "Priority": "default",
+            "Tags": "computer"
+        }
+
         # Setup basic auth if credentials provided
         self.auth = None
         if username and password:
             self.auth = (username, password)
-            self.logger.debug(f"Basic auth enabled for user: {username}")
+            self.logger.debug("Basic auth enabled for user: %s", username)
+
+        # Pooled keep-alive session with auth preset
+        self.session = create_session()
+        self.session.auth = self.auth
+
+        # Request prepared once (URL, auth and base headers); each send copies it
+        # and only fills in Title/Tags and the body
+        self._prepared_template = self.session.prepare_request(
+            requests.Request("POST", self.endpoint, headers=self._base_headers)
+        )
+        self._send_settings = self.session.merge_environment_settings(
+            self.endpoint, {}, None, None, None
+        )
+
+        # Sends are handed to a background worker so callers never block on HTTP
+        # (including retry backoff)
+        self._queue: "queue.Queue[Optional[Tuple[str, str, Optional[str]]]]" = queue.Queue()
+        self._worker_thread: Optional[threading.Thread] = None
 
     def initialize(self) -> bool:
         """Initialize Ntfy provider"""
@@ -43,8 +88,17 @@ class NtfyProvider(BaseProvider):
             self.logger.error("Invalid Ntfy configuration")
             return False
 
+        # Start the background send worker
+        self._worker_thread = threading.Thread(
+            target=self._worker,
+            name="NtfyProvider-worker",
+            daemon=True
+        )
+        self._worker_thread.start()
+
         self.enabled = True
-        self.logger.info(f"✅ Ntfy initialized (server: {self.server_url}, topic: {self.topic})")
+        warm_up(self.session, self.server_url)
+        self.logger.info("✅ Ntfy initialized (server: %s, topic: %s)", self.server_url, self.topic)
         return True
 
     def test_connection(self) -> bool:
@@ -54,7 +108,7 @@ class NtfyProvider(BaseProvider):
 
         try:
             # Test by sending a simple ping
-            response = requests.post(
+            response = self.session.post(
                 self.endpoint,
                 data="Connection test",
                 headers={
@@ -62,7 +116,6 @@ class NtfyProvider(BaseProvider):
                     "Priority": "low",
                     "Tags": "white_check_mark"
                 },
-                auth=self.auth,
                 timeout=10
             )
 
@@ -83,34 +136,56 @@ class NtfyProvider(BaseProvider):
         body: str,
         source_app: Optional[str] = None
     ) -> bool:
-        """Send notification via Ntfy"""
-        if not self.enabled:
+        """
+        Queue notification for delivery via Ntfy
+
+        Returns immediately; the HTTP request is made by the background worker.
+        """
+        if not self.enabled or self._circuit_is_open():
             return False
 
-        try:
-            # Format title with source app if provided
-            formatted_title = f"{title}" if source_app else title
+        self._queue.put((title, body, source_app))
+        return True
 
-            headers = {
-                "Title": formatted_title,
-                "Priority": "default",
-                "Tags": "computer"
-            }
+    def _worker(self):
+        """Background loop that delivers queued notifications"""
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:  # Stop sentinel from close()
+                    return
+                self._send_now(*item)
+            finally:
+                self._queue.task_done()
+
+    @record_send_result
+    def _send_now(
+        self,
+        title: str,
+        body: str,
+        source_app: Optional[str] = None
+    ) -> bool:
+        """Send notification via Ntfy (blocking)"""
+        try:
+            prepared = self._prepared_template.copy()
+            prepared.headers["Title"] = title
 
             # Add source app as a tag if provided
             if source_app:
-                headers["Tags"] = f"computer,{source_app.lower().replace(' ', '_')}"
+                prepared.headers["Tags"] = _app_tag(source_app)
 
-            response = requests.post(
-                self.endpoint,
-                data=body or "(No content)",
-                headers=headers,
-                auth=self.auth,
-                timeout=10
+            prepared.body = (body or "(No content)").encode('utf-8')
+            prepared.prepare_content_length(prepared.body)
+
+            response = send_with_retry(
+                self.session,
+                prepared,
+                timeout=10,
+                **self._send_settings
             )
 
             if response.status_code == 200:
-                self.logger.debug(f"✅ Ntfy: {title}")
+                self.logger.debug("✅ Ntfy: %s", title)
                 return True
             else:
                 self.logger.warning(f"❌ Ntfy: Failed ({response.status_code})")
@@ -119,3 +194,11 @@ class NtfyProvider(BaseProvider):
         except Exception as e:
             self.logger.error(f"❌ Ntfy error: {e}")
             return False
+
+    def close(self):
+        """Stop the send worker and close the HTTP session"""
+        self.enabled = False
+        if self._worker_thread and self._worker_thread.is_alive():
+            self._queue.put(None)
+            self._worker_thread.join(timeout=5)
+        self.session.close()
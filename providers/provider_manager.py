@@ -3,18 +3,105 @@ Provider Manager
 Manages multiple notification providers and sends to all enabled providers
 """
 
+import hashlib
 import logging
-from typing import List, Optional
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, TimeoutError, as_completed
+from typing import Callable, Dict, List, Optional
 from .base_provider import BaseProvider
 
 
 class ProviderManager:
     """Manages multiple notification providers"""
 
+    # Maximum time to wait for all providers to finish (seconds)
+    SEND_TIMEOUT = 15
+
+    # Identical notifications within this window (seconds) are sent only once
+    DEDUP_WINDOW = 5.0
+
+    # Maximum number of recent notifications remembered for de-duplication
+    DEDUP_MAX = 128
+
     def __init__(self):
         """Initialize the provider manager"""
         self.providers: List[BaseProvider] = []
         self.logger = logging.getLogger(__name__)
+        self._enabled_cache: Optional[List[BaseProvider]] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+        # Recently sent notification digests -> time.monotonic() of last send
+        self._recent: "OrderedDict[bytes, float]" = OrderedDict()
+        self._recent_lock = threading.Lock()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the thread pool used for fan-out, sized to the number of providers"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=max(1, len(self.providers)),
+                thread_name_prefix="ProviderManager"
+            )
+        return self._executor
+
+    def _run_concurrently(
+        self,
+        providers: List[BaseProvider],
+        call: Callable[[BaseProvider], bool],
+        action: str
+    ) -> Dict[str, bool]:
+        """
+        Run a call against each provider in parallel
+
+        Args:
+            providers: Providers to run the call for
+            call: Function taking a provider and returning its result
+            action: Description used in log messages (e.g. 'sending')
+
+        Returns:
+            Dictionary with provider names as keys and results as values
+        """
+        results = {}
+        executor = self._get_executor()
+        futures = {executor.submit(call, provider): provider for provider in providers}
+
+        try:
+            for future in as_completed(futures, timeout=self.SEND_TIMEOUT):
+                provider = futures[future]
+                try:
+                    results[provider.get_name()] = future.result()
+                except Exception as e:
+                    self.logger.error(f"Error {action} via {provider.get_name()}: {e}")
+                    results[provider.get_name()] = False
+        except TimeoutError:
+            for future, provider in futures.items():
+                if not future.done():
+                    self.logger.warning(f"Timed out {action} via {provider.get_name()}")
+                    results[provider.get_name()] = False
+
+        return results
+
+    def _is_duplicate(self, title: str, body: str, source_app: Optional[str]) -> bool:
+        """
+        Check whether the same notification was sent within DEDUP_WINDOW, and record it
+
+        Returns:
+            True if this notification is a recent duplicate
+        """
+        key = hashlib.blake2b(f"{title}|{body}|{source_app}".encode(), digest_size=8).digest()
+        now = time.monotonic()
+
+        with self._recent_lock:
+            last_sent = self._recent.get(key)
+            if last_sent is not None and now - last_sent < self.DEDUP_WINDOW:
+                return True
+
+            self._recent[key] = now
+            self._recent.move_to_end(key)
+            while len(self._recent) > self.DEDUP_MAX:
+                self._recent.popitem(last=False)
+            return False
 
     def add_provider(self, provider: BaseProvider) -> bool:
         """
@@ -30,7 +117,14 @@ class ProviderManager:
             # Initialize the provider
             if provider.initialize():
                 self.providers.append(provider)
-                self.logger.info(f"✅ Added provider: {provider.get_name()}")
+                self.invalidate_enabled_cache()
+
+                # Resize the fan-out pool on next send
+                if self._executor is not None:
+                    self._executor.shutdown(wait=False)
+                    self._executor = None
+
+                self.logger.info("✅ Added provider: %s", provider.get_name())
                 return True
             else:
                 self.logger.warning(f"⚠️  Failed to initialize provider: {provider.get_name()}")
@@ -40,8 +134,14 @@ class ProviderManager:
             return False
 
     def get_enabled_providers(self) -> List[BaseProvider]:
-        """Get list of enabled providers"""
-        return [p for p in self.providers if p.is_enabled()]
+        """Get list of enabled providers (cached until invalidate_enabled_cache())"""
+        if self._enabled_cache is None:
+            self._enabled_cache = [p for p in self.providers if p.is_enabled()]
+        return self._enabled_cache
+
+    def invalidate_enabled_cache(self):
+        """Rebuild the enabled provider list on next use (call after enabling/disabling a provider)"""
+        self._enabled_cache = None
 
     def get_provider_count(self) -> int:
         """Get number of enabled providers"""
@@ -54,11 +154,11 @@ class ProviderManager:
         Returns:
             Dictionary with provider names as keys and test results as values
         """
-        results = {}
-        for provider in self.providers:
-            if provider.is_enabled():
-                results[provider.get_name()] = provider.test_connection()
-        return results
+        return self._run_concurrently(
+            self.get_enabled_providers(),
+            lambda provider: provider.test_connection(),
+            "testing connection"
+        )
 
     def send_notification(
         self,
@@ -84,21 +184,38 @@ class ProviderManager:
             self.logger.warning("No enabled providers to send notification")
             return results
 
-        for provider in enabled_providers:
-            try:
-                success = provider.send_notification(title, body, source_app)
-                results[provider.get_name()] = success
-            except Exception as e:
-                self.logger.error(f"Error sending via {provider.get_name()}: {e}")
-                results[provider.get_name()] = False
+        # Windows often raises the same toast twice; only send it once
+        if self._is_duplicate(title, body, source_app):
+            self.logger.info("Skipping duplicate notification: %s", title)
+            return {p.get_name(): True for p in enabled_providers}
+
+        # Send to all providers concurrently
+        results = self._run_concurrently(
+            enabled_providers,
+            lambda provider: provider.send_notification(title, body, source_app),
+            "sending"
+        )
 
         # Log summary
         successful = sum(1 for v in results.values() if v)
         total = len(results)
-        self.logger.info(f"📤 Sent to {successful}/{total} providers")
+        self.logger.info("📤 Sent to %d/%d providers", successful, total)
 
         return results
 
+    def close(self):
+        """Close all providers and stop the fan-out thread pool"""
+        for provider in self.providers:
+            try:
+                provider.close()
+            except Exception as e:
+                self.logger.error(f"Error closing provider {provider.get_name()}: {e}")
+        self.invalidate_enabled_cache()
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
     def get_summary(self) -> str:
         """Get a summary of enabled providers"""
         enabled = self.get_enabled_providers()
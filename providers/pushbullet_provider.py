@@ -3,9 +3,13 @@ Pushbullet Provider
 Send notifications via Pushbullet API
 """
 
-import requests
-from typing import Optional
-from .base_provider import BaseProvider
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, Optional
+from .base_provider import BaseProvider, record_send_result
+from utils.http_retry import post_with_retry
+from utils.http_session import create_session, warm_up
 
 class PushbulletProvider(BaseProvider):
     """Pushbullet notification provider"""
@@ -26,13 +30,33 @@ class PushbulletProvider(BaseProvider):
             "Content-Type": "application/json"
         }
 
+        # Pooled keep-alive session with the auth headers preset
+        self.session = create_session()
+        self.session.headers.update(self.headers)
+
+        # Pushes are buffered and flushed in bursts by a background thread
+        self.flush_interval = 0.2  # Seconds to collect a burst before flushing
+        self._pending: Deque[Dict[str, str]] = deque()
+        self._pending_event = threading.Event()
+        self._closing = False
+        self._flush_thread: Optional[threading.Thread] = None
+
     def initialize(self) -> bool:
         """Initialize Pushbullet provider"""
         if not self.api_token or len(self.api_token) < 10:
             self.logger.error("Invalid Pushbullet API token")
             return False
 
+        # Start the background flush loop
+        self._flush_thread = threading.Thread(
+            target=self._flush_loop,
+            name="PushbulletProvider-flush",
+            daemon=True
+        )
+        self._flush_thread.start()
+
         self.enabled = True
+        warm_up(self.session, self.API_URL)
         self.logger.info("✅ Pushbullet initialized")
         return True
 
@@ -43,9 +67,8 @@ class PushbulletProvider(BaseProvider):
 
         try:
             # Test by getting user info
-            response = requests.get(
+            response = self.session.get(
                 f"{self.API_URL}/users/me",
-                headers=self.headers,
                 timeout=10
             )
 
@@ -66,29 +89,47 @@ class PushbulletProvider(BaseProvider):
         body: str,
         source_app: Optional[str] = None
     ) -> bool:
-        """Send notification via Pushbullet"""
-        if not self.enabled:
+        """
+        Queue notification for delivery via Pushbullet
+
+        Returns immediately; pushes are sent in bursts by the flush thread.
+        """
+        if not self.enabled or self._circuit_is_open():
             return False
 
-        try:
-            # Format title with source app if provided
-            formatted_title = f"{title}" if source_app else title
+        self._pending.append({
+            "type": "note",
+            "title": title,
+            "body": body or "(No content)"
+        })
+        self._pending_event.set()
+        return True
+
+    def _flush_loop(self):
+        """Background loop that sends buffered pushes back-to-back on the shared session"""
+        while not self._closing:
+            self._pending_event.wait()
 
-            payload = {
-                "type": "note",
-                "title": formatted_title,
-                "body": body or "(No content)"
-            }
+            # Give a burst of notifications a moment to arrive
+            time.sleep(self.flush_interval)
+            self._pending_event.clear()
 
-            response = requests.post(
+            while self._pending:
+                self._send_now(self._pending.popleft())
+
+    @record_send_result
+    def _send_now(self, payload: Dict[str, str]) -> bool:
+        """Send a push via Pushbullet (blocking)"""
+        try:
+            response = post_with_retry(
+                self.session,
                 f"{self.API_URL}/pushes",
-                headers=self.headers,
                 json=payload,
                 timeout=10
             )
 
             if response.status_code == 200:
-                self.logger.debug(f"✅ Pushbullet: {title}")
+                self.logger.debug("✅ Pushbullet: %s", payload["title"])
                 return True
             else:
                 self.logger.warning(f"❌ Pushbullet: Failed ({response.status_code})")
@@ -97,3 +138,12 @@ class PushbulletProvider(BaseProvider):
         except Exception as e:
             self.logger.error(f"❌ Pushbullet error: {e}")
             return False
+
+    def close(self):
+        """Flush pending pushes, stop the flush thread and close the HTTP session"""
+        self.enabled = False
+        self._closing = True
+        self._pending_event.set()
+        if self._flush_thread and self._flush_thread.is_alive():
+            self._flush_thread.join(timeout=5)
+        self.session.close()
@@ -0,0 +1,36 @@
+"""
+Compile .env into a Python module for frozen executables
+Run this before building the executable so the EXE does not parse .env at startup
+
+Usage:
+    python tools/compile_env.py [path/to/.env] [path/to/compiled_env.py]
+"""
+import sys
+from pathlib import Path
+from dotenv import dotenv_values
+
+app_dir = Path(__file__).resolve().parent.parent
+
+env_file = Path(sys.argv[1]) if len(sys.argv) > 1 else app_dir / ".env"
+output_file = Path(sys.argv[2]) if len(sys.argv) > 2 else app_dir / "compiled_env.py"
+
+if not env_file.exists():
+    print(f"✗ No .env file found at {env_file}")
+    sys.exit(1)
+
+# Drop keys without a value (e.g. "KEY" with no "=")
+values = {key: value for key, value in dotenv_values(env_file).items() if value is not None}
+
+lines = [
+    '"""',
+    "Configuration compiled from .env by tools/compile_env.py - do not edit",
+    "Contains credentials: never commit this file",
+    '"""',
+    "",
+    "ENV = {",
+]
+lines.extend(f"    {key!r}: {value!r}," for key, value in values.items())
+lines.append("}")
+
+output_file.write_text("\n".join(lines) + "\n", encoding="utf-8")
+print(f"✓ Compiled {len(values)} variables from {env_file} into {output_file}")
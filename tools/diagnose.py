@@ -1,122 +1,233 @@
 """
 Diagnostic script to check notification access
 Run this to see what's wrong
+
+Pass --json to print the results as JSON instead (no prompts, for headless use)
 """
 import sys
+import json
 import asyncio
+import importlib.metadata
+import importlib.util
+import traceback
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-print("=" * 60)
-print("Windows Notification Forwarder - Diagnostics")
-print("=" * 60)
-print()
-
-# Check Python version
-print(f"Python version: {sys.version}")
-print(f"Python executable: {sys.executable}")
-print()
-
-# Check if running as exe or script
-if getattr(sys, 'frozen', False):
-    print("Running as: COMPILED EXECUTABLE")
-    app_dir = Path(sys.executable).parent
-else:
-    print("Running as: PYTHON SCRIPT")
-    app_dir = Path(__file__).parent
-
-print(f"App directory: {app_dir}")
-print(f"Current directory: {Path.cwd()}")
-print()
-
-# Check if .env exists
-env_file = app_dir / ".env"
-print(f"Looking for .env at: {env_file}")
-print(f".env exists: {env_file.exists()}")
-print()
-
-# Check dependencies
-print("Checking dependencies...")
 deps = {
     "winrt": "winrt-runtime",
     "requests": "requests",
-    "dotenv": "python-dotenv"
+    "dotenv": "python-dotenv",
+    "google.auth": "google-auth",
+    "httpx": "httpx",
+    "h2": "h2"
 }
 
-for module, package in deps.items():
+
+def get_app_dir() -> Path:
+    """Directory of the executable when compiled, otherwise of this script"""
+    if getattr(sys, 'frozen', False):
+        return Path(sys.executable).parent
+    return Path(__file__).parent
+
+
+def probe_dependency(item):
+    """Check a module is importable (without importing it) and look up its package version"""
+    module, package = item
     try:
-        __import__(module)
-        print(f"  ✓ {module} installed")
-    except ImportError:
-        print(f"  ✗ {module} NOT installed - run: pip install {package}")
+        if importlib.util.find_spec(module) is None:
+            return module, package, None
+    except ImportError:  # Parent package (e.g. google) missing
+        return module, package, None
+    try:
+        version = importlib.metadata.version(package)
+    except importlib.metadata.PackageNotFoundError:
+        version = "unknown version"
+    return module, package, version
+
 
-print()
+def probe_dependencies():
+    """Probe all dependencies concurrently"""
+    with ThreadPoolExecutor(max_workers=len(deps)) as executor:
+        return list(executor.map(probe_dependency, deps.items()))
 
-# Try to import WinRT
-try:
+
+def import_winrt():
+    """Import the WinRT notification modules"""
     from winrt.windows.ui.notifications.management import UserNotificationListener, UserNotificationListenerAccessStatus
     from winrt.windows.ui.notifications import NotificationKinds
-    print("✓ WinRT modules imported successfully")
-    print()
-except Exception as e:
-    print(f"✗ Failed to import WinRT modules: {e}")
-    print()
-    input("Press Enter to exit...")
-    sys.exit(1)
+    return UserNotificationListener, UserNotificationListenerAccessStatus, NotificationKinds
+
+
+async def check_env(app_dir: Path):
+    """Check if .env exists"""
+    loop = asyncio.get_running_loop()
+    env_file = app_dir / ".env"
+    exists = await loop.run_in_executor(None, env_file.exists)
+    return {"path": str(env_file), "exists": exists}
+
+
+async def check_deps():
+    """Check dependencies"""
+    loop = asyncio.get_running_loop()
+    results = await loop.run_in_executor(None, probe_dependencies)
+    return [
+        {"module": module, "package": package, "installed": version is not None, "version": version}
+        for module, package, version in results
+    ]
+
 
-# Try to get listener
 async def test_listener():
-    print("Testing UserNotificationListener...")
+    """Import WinRT, request notification access and count Action Center notifications"""
+    result = {
+        "imported": False,
+        "import_error": None,
+        "access_status": None,
+        "notification_count": None,
+        "error": None,
+        "traceback": None
+    }
+
+    loop = asyncio.get_running_loop()
     try:
-        listener = UserNotificationListener.current
-        print(f"✓ Got listener: {listener}")
-        print()
+        UserNotificationListener, _, NotificationKinds = await loop.run_in_executor(None, import_winrt)
+    except Exception as e:
+        result["import_error"] = str(e)
+        return result
+    result["imported"] = True
 
-        print("Requesting notification access...")
+    try:
+        listener = UserNotificationListener.current
         access_status = await listener.request_access_async()
+        result["access_status"] = getattr(access_status, "name", str(access_status))
+
+        if result["access_status"] == "ALLOWED":
+            notifications = await listener.get_notifications_async(NotificationKinds.TOAST)
+            result["notification_count"] = len(notifications) if notifications else 0
 
-        print(f"Access status: {access_status}")
+    except Exception as e:
+        result["error"] = str(e)
+        result["traceback"] = traceback.format_exc()
 
-        if access_status == UserNotificationListenerAccessStatus.ALLOWED:
-            print("✓ ACCESS GRANTED!")
-            print()
+    return result
 
-            # Try to get notifications
-            print("Trying to get notifications...")
-            notifications = await listener.get_notifications_async(NotificationKinds.TOAST)
 
-            if notifications:
-                print(f"✓ Found {len(notifications)} notifications in Action Center")
-            else:
-                print("⚠ No notifications found in Action Center")
-                print("  This is normal if Action Center is empty")
-
-        elif access_status == UserNotificationListenerAccessStatus.DENIED:
-            print("✗ ACCESS DENIED!")
-            print()
-            print("To fix this:")
-            print("1. Open Settings > Privacy & Security > Notifications")
-            print("2. Look for 'Python' or 'python.exe'")
-            print("3. Toggle notification access ON")
-
-        elif access_status == UserNotificationListenerAccessStatus.UNSPECIFIED:
-            print("✗ ACCESS UNSPECIFIED - App not recognized by Windows")
-            print()
-            print("The application doesn't have proper Windows identity.")
-            print()
-            print("Solution:")
-            print("1. Run as Administrator: powershell -ExecutionPolicy Bypass -File register_app.ps1")
-            print("2. Then manually enable in Settings > Privacy > Notifications")
+def print_report(report):
+    """Print the diagnostics in human-readable form"""
+    print("=" * 60)
+    print("Windows Notification Forwarder - Diagnostics")
+    print("=" * 60)
+    print()
 
+    # Python version
+    print(f"Python version: {report['python']['version']}")
+    print(f"Python executable: {report['python']['executable']}")
+    print()
+
+    # Running as exe or script
+    print(f"Running as: {'COMPILED EXECUTABLE' if report['frozen'] else 'PYTHON SCRIPT'}")
+    print(f"App directory: {report['app_dir']}")
+    print(f"Current directory: {report['cwd']}")
+    print()
+
+    print(f"Looking for .env at: {report['env']['path']}")
+    print(f".env exists: {report['env']['exists']}")
+    print()
+
+    print("Checking dependencies...")
+    for dep in report["dependencies"]:
+        if dep["installed"]:
+            print(f"  ✓ {dep['module']} installed ({dep['version']})")
         else:
-            print(f"✗ Unknown access status: {access_status}")
+            print(f"  ✗ {dep['module']} NOT installed - run: pip install {dep['package']}")
+    print()
 
-    except Exception as e:
-        print(f"✗ Error: {e}")
-        import traceback
-        traceback.print_exc()
+    winrt = report["winrt"]
+    if not winrt["imported"]:
+        print(f"✗ Failed to import WinRT modules: {winrt['import_error']}")
+        print()
+        return
+
+    print("✓ WinRT modules imported successfully")
+    print()
+
+    print("Testing UserNotificationListener...")
+    status = winrt["access_status"]
+    if status is not None:
+        print(f"Access status: {status}")
+
+    if status == "ALLOWED":
+        print("✓ ACCESS GRANTED!")
+        print()
+        if winrt["notification_count"]:
+            print(f"✓ Found {winrt['notification_count']} notifications in Action Center")
+        elif winrt["notification_count"] == 0:
+            print("⚠ No notifications found in Action Center")
+            print("  This is normal if Action Center is empty")
+
+    elif status == "DENIED":
+        print("✗ ACCESS DENIED!")
+        print()
+        print("To fix this:")
+        print("1. Open Settings > Privacy & Security > Notifications")
+        print("2. Look for 'Python' or 'python.exe'")
+        print("3. Toggle notification access ON")
+
+    elif status == "UNSPECIFIED":
+        print("✗ ACCESS UNSPECIFIED - App not recognized by Windows")
+        print()
+        print("The application doesn't have proper Windows identity.")
+        print()
+        print("Solution:")
+        print("1. Run as Administrator: powershell -ExecutionPolicy Bypass -File register_app.ps1")
+        print("2. Then manually enable in Settings > Privacy > Notifications")
+
+    elif status is not None:
+        print(f"✗ Unknown access status: {status}")
+
+    if winrt["error"]:
+        print(f"✗ Error: {winrt['error']}")
+        print(winrt["traceback"], end="")
 
     print()
-    input("Press Enter to exit...")
 
-# Run the test
-asyncio.run(test_listener())
+
+async def main(as_json: bool = False) -> int:
+    """
+    Run all checks concurrently and report the results
+
+    Args:
+        as_json: Print the results as JSON instead of the text report
+
+    Returns:
+        Process exit code (1 if WinRT could not be imported)
+    """
+    app_dir = get_app_dir()
+
+    env, dependencies, winrt = await asyncio.gather(
+        check_env(app_dir),
+        check_deps(),
+        test_listener()
+    )
+
+    report = {
+        "python": {"version": sys.version, "executable": sys.executable},
+        "frozen": bool(getattr(sys, 'frozen', False)),
+        "app_dir": str(app_dir),
+        "cwd": str(Path.cwd()),
+        "env": env,
+        "dependencies": dependencies,
+        "winrt": winrt
+    }
+
+    if as_json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+        if sys.stdin.isatty():
+            input("Press Enter to exit...")
+
+    return 0 if winrt["imported"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main(as_json="--json" in sys.argv[1:])))
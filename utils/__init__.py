@@ -2,5 +2,7 @@
 Utility modules for notification providers
 """
 from .fcm_v1_helper import FCMv1Notifier
+from .http_retry import post_with_retry, send_with_retry
+from .http_session import create_session, warm_up
 
-__all__ = ['FCMv1Notifier']
+__all__ = ['FCMv1Notifier', 'post_with_retry', 'send_with_retry', 'create_session', 'warm_up']
@@ -0,0 +1,129 @@
+"""
+Async FCM HTTP v1 API Helper - Broadcast to many topics concurrently
+Shares one HTTP/2 connection across sends so fan-out is bound by the slowest request
+
+Usage:
+    from utils.fcm_v1_async_helper import AsyncFCMv1Notifier
+
+    async with AsyncFCMv1Notifier('service-account.json') as fcm:
+        await fcm.send_many(['windows_notifications', 'all_notifications'], 'Hello', 'This is a test')
+"""
+import asyncio
+import logging
+from typing import Dict, List, Optional
+import httpx
+from utils.fcm_v1_helper import FCMv1Notifier, _dumps, _loads
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncFCMv1Notifier(FCMv1Notifier):
+    """Send push notifications via FCM HTTP v1 API using asyncio"""
+
+    def __init__(self, service_account_file: str):
+        """
+        Initialize async FCM v1 Notifier
+
+        Sends go through the async client only; the sync HTTP/2 client is never created.
+
+        Args:
+            service_account_file: Path to Firebase service account JSON file
+        """
+        super().__init__(service_account_file)
+        self.async_client: Optional[httpx.AsyncClient] = None
+
+    async def __aenter__(self) -> "AsyncFCMv1Notifier":
+        """Open the HTTP/2 async client"""
+        self.async_client = httpx.AsyncClient(
+            http2=True,
+            timeout=10.0,
+            limits=httpx.Limits(max_connections=32)
+        )
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        """Close the async client and the sync client/session"""
+        if self.async_client:
+            await self.async_client.aclose()
+            self.async_client = None
+        self.close()
+
+    async def _get_access_token_async(self) -> str:
+        """Get the cached access token, refreshing it off the event loop when needed"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.get_access_token)
+
+    async def send_to_topic_async(
+        self,
+        topic: str,
+        title: str,
+        body: str,
+        category: str = "General",
+        source: str = "Python",
+        data: Optional[Dict] = None
+    ) -> bool:
+        """
+        Send a push notification to a topic
+
+        Args:
+            topic: Topic name (e.g., 'all_notifications', 'windows_notifications')
+            title: Notification title
+            body: Notification body/message
+            category: Category (General, Windows, Alert, Info, System)
+            source: Source of the notification
+            data: Additional custom data (optional)
+
+        Returns:
+            True if sent successfully, False otherwise
+        """
+        if not self.async_client:
+            raise RuntimeError("AsyncFCMv1Notifier must be used as 'async with'")
+
+        try:
+            headers = self._build_headers(await self._get_access_token_async())
+            payload = self._build_topic_payload(topic, title, body, category, source, data)
+
+            response = await self.async_client.post(self.fcm_url, headers=headers, content=_dumps(payload))
+
+            if response.status_code == 200:
+                result = _loads(response.content)
+                logger.debug("✓ Notification sent to topic '%s': %s (message ID: %s)",
+                             topic, title, result.get('name', 'N/A'))
+                return True
+
+            if response.status_code == 401:
+                self.invalidate_access_token()
+            logger.error("✗ HTTP Error %d: %s", response.status_code, response.text)
+            return False
+
+        except httpx.HTTPError as e:
+            logger.error("✗ Network error: %s", e)
+            return False
+        except Exception as e:
+            logger.error("✗ Error: %s", e)
+            return False
+
+    async def send_many(
+        self,
+        topics: List[str],
+        title: str,
+        body: str,
+        category: str = "General",
+        source: str = "Python"
+    ) -> List[bool]:
+        """
+        Send the same notification to several topics concurrently
+
+        Args:
+            topics: Topic names to send to
+            title: Notification title
+            body: Notification body/message
+            category: Category
+            source: Source
+
+        Returns:
+            Send result for each topic, in order
+        """
+        return await asyncio.gather(
+            *(self.send_to_topic_async(topic, title, body, category, source) for topic in topics)
+        )
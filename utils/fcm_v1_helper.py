@@ -3,7 +3,7 @@ FCM HTTP v1 API Helper - Modern way to send notifications
 Uses service account credentials and OAuth2 instead of legacy server key
 
 Prerequisites:
-    pip install google-auth requests
+    pip install google-auth requests "httpx[http2]"
 
 Setup:
     1. Go to Firebase Console > Project Settings > Service Accounts
@@ -18,79 +18,125 @@ Usage:
     fcm.send_to_topic('all_notifications', 'Hello', 'This is a test')
 """
 import json
+import logging
+import threading
+import httpx
 import requests
 from typing import Optional, Dict
 from google.auth.transport.requests import Request
 from google.oauth2 import service_account
+from utils.http_retry import post_with_retry
+
+try:
+    import orjson
+except ImportError:  # Optional: faster JSON serialization
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+
+def _dumps(payload: Dict) -> bytes:
+    """Serialize a JSON payload to UTF-8 bytes (orjson when available)"""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _loads(content: bytes) -> Dict:
+    """Parse a JSON response body (orjson when available)"""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
 
 class FCMv1Notifier:
     """Send push notifications via Firebase Cloud Messaging HTTP v1 API"""
 
     SCOPES = ['https://www.googleapis.com/auth/firebase.messaging']
 
-    def __init__(self, service_account_file: str):
+    def __init__(
+        self,
+        service_account_file: str,
+        session: Optional[requests.Session] = None,
+        client: Optional[httpx.Client] = None
+    ):
         """
         Initialize FCM v1 Notifier
 
         Args:
             service_account_file: Path to Firebase service account JSON file
+            session: HTTP session for OAuth2 token refreshes (optional)
+            client: HTTP/2 client for sends (optional, created on first use)
         """
         self.service_account_file = service_account_file
-        self.project_id = self._load_project_id()
+        self.session = session or requests.Session()
+        self._client = client
+
+        # Read the service account file once for both the project ID and credentials
+        with open(self.service_account_file, 'rb') as f:
+            service_account_info = _loads(f.read())
+
+        self.project_id = service_account_info['project_id']
         self.fcm_url = f"https://fcm.googleapis.com/v1/projects/{self.project_id}/messages:send"
 
-    def _load_project_id(self) -> str:
-        """Load project ID from service account file"""
-        with open(self.service_account_file, 'r') as f:
-            service_account_info = json.load(f)
-        return service_account_info['project_id']
+        # Credentials are built once; the token is refreshed only when expired.
+        # google-auth's transport needs a requests session.
+        self._credentials = service_account.Credentials.from_service_account_info(
+            service_account_info,
+            scopes=self.SCOPES
+        )
+        self._auth_request = Request(session=self.session)
+        self._token_lock = threading.Lock()
 
-    def _get_access_token(self) -> str:
+    def get_access_token(self) -> str:
         """
-        Get OAuth2 access token using service account credentials
+        Get OAuth2 access token, refreshing the cached one only when it has expired
 
         Returns:
             Access token string
         """
-        credentials = service_account.Credentials.from_service_account_file(
-            self.service_account_file,
-            scopes=self.SCOPES
-        )
-        request = Request()
-        credentials.refresh(request)
-        return credentials.token
+        # Lock so concurrent senders don't refresh the same token twice
+        with self._token_lock:
+            if not self._credentials.valid:
+                self._credentials.refresh(self._auth_request)
+            return self._credentials.token
+
+    def invalidate_access_token(self):
+        """Drop the cached access token so the next request fetches a new one"""
+        with self._token_lock:
+            self._credentials.token = None
+
+    @property
+    def client(self) -> httpx.Client:
+        """HTTP/2 client for sends (multiplexes concurrent sends), created on first use"""
+        if self._client is None:
+            self._client = httpx.Client(http2=True, timeout=10.0)
+        return self._client
+
+    def close(self):
+        """Close the HTTP client and session"""
+        if self._client is not None:
+            self._client.close()
+        self.session.close()
+
+    def _build_headers(self, access_token: str) -> Dict[str, str]:
+        """Build request headers for an access token"""
+        return {
+            'Authorization': f'Bearer {access_token}',
+            'Content-Type': 'application/json; charset=utf-8',
+        }
 
-    def send_to_topic(
+    def _build_topic_payload(
         self,
         topic: str,
         title: str,
         body: str,
-        category: str = "General",
-        source: str = "Python",
+        category: str,
+        source: str,
         data: Optional[Dict] = None
-    ) -> bool:
-        """
-        Send a push notification to a topic
-
-        Args:
-            topic: Topic name (e.g., 'all_notifications', 'windows_notifications')
-            title: Notification title
-            body: Notification body/message
-            category: Category (General, Windows, Alert, Info, System)
-            source: Source of the notification
-            data: Additional custom data (optional)
-
-        Returns:
-            True if sent successfully, False otherwise
-        """
-        access_token = self._get_access_token()
-
-        headers = {
-            'Authorization': f'Bearer {access_token}',
-            'Content-Type': 'application/json; UTF-8',
-        }
-
-        payload = {
+    ) -> Dict:
+        """Build the message payload for a topic send"""
+        return {
             'message': {
                 'topic': topic,
                 'notification': {
@@ -111,28 +157,57 @@ class FCMv1Notifier:
             }
         }
 
+    def send_to_topic(
+        self,
+        topic: str,
+        title: str,
+        body: str,
+        category: str = "General",
+        source: str = "Python",
+        data: Optional[Dict] = None
+    ) -> bool:
+        """
+        Send a push notification to a topic
+
+        Args:
+            topic: Topic name (e.g., 'all_notifications', 'windows_notifications')
+            title: Notification title
+            body: Notification body/message
+            category: Category (General, Windows, Alert, Info, System)
+            source: Source of the notification
+            data: Additional custom data (optional)
+
+        Returns:
+            True if sent successfully, False otherwise
+        """
+        headers = self._build_headers(self.get_access_token())
+        payload = self._build_topic_payload(topic, title, body, category, source, data)
+
         try:
-            response = requests.post(
+            response = post_with_retry(
+                self.client,
                 self.fcm_url,
                 headers=headers,
-                json=payload,
-                timeout=10
+                content=_dumps(payload),
+                retry_exceptions=(httpx.ConnectError, httpx.ConnectTimeout)
             )
 
             if response.status_code == 200:
-                result = response.json()
-                print(f"✓ Notification sent to topic '{topic}': {title}")
-                print(f"  Message ID: {result.get('name', 'N/A')}")
+                result = _loads(response.content)
+                logger.debug("✓ Notification sent to topic '%s': %s (message ID: %s)",
+                             topic, title, result.get('name', 'N/A'))
                 return True
             else:
-                print(f"✗ HTTP Error {response.status_code}: {response.text}")
+                if response.status_code == 401:
+                    self.invalidate_access_token()
+                logger.error("✗ HTTP Error %d: %s", response.status_code, response.text)
                 return False
 
-        except requests.exceptions.RequestException as e:
-            print(f"✗ Network error: {e}")
+        except httpx.HTTPError as e:
+            logger.error("✗ Network error: %s", e)
             return False
         except Exception as e:
-            print(f"✗ Error: {e}")
+            logger.error("✗ Error: %s", e)
             return False
 
     def send_windows_notification(
@@ -156,7 +231,7 @@ class FCMv1Notifier:
         """
         return self.send_to_topic(
             topic=topic,
-            title=f"{title}" if title else f"[{app_name}]",
+            title=title or f"[{app_name}]",
             body=body,
             category="Windows",
             source=app_name
@@ -184,12 +259,7 @@ class FCMv1Notifier:
         Returns:
             True if sent successfully
         """
-        access_token = self._get_access_token()
-
-        headers = {
-            'Authorization': f'Bearer {access_token}',
-            'Content-Type': 'application/json; UTF-8',
-        }
+        headers = self._build_headers(self.get_access_token())
 
         payload = {
             'message': {
@@ -206,26 +276,31 @@ class FCMv1Notifier:
         }
 
         try:
-            response = requests.post(
+            response = post_with_retry(
+                self.client,
                 self.fcm_url,
                 headers=headers,
-                json=payload,
-                timeout=10
+                content=_dumps(payload),
+                retry_exceptions=(httpx.ConnectError, httpx.ConnectTimeout)
             )
 
             if response.status_code == 200:
-                print(f"✓ Notification sent to condition: {title}")
+                logger.debug("✓ Notification sent to condition: %s", title)
                 return True
             else:
-                print(f"✗ HTTP Error {response.status_code}: {response.text}")
+                if response.status_code == 401:
+                    self.invalidate_access_token()
+                logger.error("✗ HTTP Error %d: %s", response.status_code, response.text)
                 return False
 
         except Exception as e:
-            print(f"✗ Error: {e}")
+            logger.error("✗ Error: %s", e)
             return False
 
 # Example usage
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG)
+
     # Initialize with service account file
     fcm = FCMv1Notifier('service-account.json')
 
@@ -0,0 +1,175 @@
+"""
+HTTP retry helper for notification providers
+Retries transient failures with exponential backoff, honoring Retry-After
+"""
+import logging
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, FrozenSet, Optional, Tuple, Type
+import requests
+
+logger = logging.getLogger(__name__)
+
+# Only rate limiting and server-side errors are retried; other 4xx are final
+RETRY_STATUSES: FrozenSet[int] = frozenset({429, 500, 502, 503, 504})
+
+# Network errors worth retrying (requests sessions). Read timeouts are not
+# retried: the server may already have accepted the notification.
+RETRY_EXCEPTIONS: Tuple[Type[Exception], ...] = (
+    requests.exceptions.ConnectionError,
+    requests.exceptions.ConnectTimeout,
+)
+
+# Total time budget for all attempts (seconds); bounds how long a failing
+# send holds up a provider's background worker
+RETRY_DEADLINE = 12.0
+
+# Minimum time left for another attempt to be worth starting (seconds)
+_MIN_ATTEMPT_SECONDS = 1.0
+
+
+def _retry_after_seconds(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header (delay in seconds or HTTP date)
+
+    Returns:
+        Delay in seconds, or None if missing/invalid
+    """
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+        return max(0.0, retry_at.timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def _request_with_retry(
+    request: Callable[[float], Any],
+    description: str,
+    max_retries: int,
+    base_delay: float,
+    jitter: float,
+    max_delay: float,
+    retry_statuses: FrozenSet[int],
+    retry_exceptions: Tuple[Type[Exception], ...],
+    timeout: float,
+    deadline: float
+) -> Any:
+    """
+    Run request(timeout) until it returns a non-retryable response, retries
+    run out or the deadline would be exceeded
+    """
+    deadline_at = time.monotonic() + deadline
+    for attempt in range(max_retries + 1):
+        last_attempt = attempt == max_retries
+        response = None
+        error = None
+        retry_after = None
+        try:
+            response = request(min(timeout, max(_MIN_ATTEMPT_SECONDS, deadline_at - time.monotonic())))
+            if response.status_code not in retry_statuses or last_attempt:
+                return response
+            retry_after = _retry_after_seconds(response.headers.get("Retry-After"))
+            reason = f"HTTP {response.status_code}"
+        except retry_exceptions as e:
+            if last_attempt:
+                raise
+            error = e
+            reason = str(e)
+
+        delay = retry_after if retry_after is not None else base_delay * 2 ** attempt
+        delay = min(max_delay, delay * (1 + random.random() * jitter))
+
+        if time.monotonic() + delay + _MIN_ATTEMPT_SECONDS > deadline_at:
+            logger.debug("Giving up on %s: retry deadline reached (%s)", description, reason)
+            if error is not None:
+                raise error
+            return response
+
+        logger.debug("Retrying %s in %.1fs (%s)", description, delay, reason)
+        time.sleep(delay)
+
+
+def post_with_retry(
+    session: Any,
+    url: str,
+    *,
+    max_retries: int = 3,
+    base_delay: float = 1.0,
+    jitter: float = 0.5,
+    max_delay: float = 60.0,
+    retry_statuses: FrozenSet[int] = RETRY_STATUSES,
+    retry_exceptions: Tuple[Type[Exception], ...] = RETRY_EXCEPTIONS,
+    timeout: float = 10.0,
+    deadline: float = RETRY_DEADLINE,
+    **kwargs: Any
+) -> Any:
+    """
+    POST with retries on connection errors and retryable HTTP statuses
+
+    Args:
+        session: Session to send the request with (requests.Session or httpx.Client)
+        url: Request URL
+        max_retries: Number of retries after the first attempt
+        base_delay: Initial backoff delay in seconds (doubled per attempt)
+        jitter: Random fraction added to each delay
+        max_delay: Upper bound for a single delay in seconds
+        retry_statuses: HTTP status codes that trigger a retry
+        retry_exceptions: Network errors that trigger a retry
+        timeout: Per-attempt timeout in seconds (shortened to fit the deadline)
+        deadline: Total time budget in seconds for all attempts and delays
+        **kwargs: Passed through to session.post()
+
+    Returns:
+        The last response received
+
+    Raises:
+        Exception: One of retry_exceptions if the final attempt fails with a network error
+    """
+    return _request_with_retry(
+        lambda attempt_timeout: session.post(url, timeout=attempt_timeout, **kwargs),
+        f"POST {url}",
+        max_retries, base_delay, jitter, max_delay, retry_statuses, retry_exceptions,
+        timeout, deadline
+    )
+
+
+def send_with_retry(
+    session: requests.Session,
+    prepared: requests.PreparedRequest,
+    *,
+    max_retries: int = 3,
+    base_delay: float = 1.0,
+    jitter: float = 0.5,
+    max_delay: float = 60.0,
+    retry_statuses: FrozenSet[int] = RETRY_STATUSES,
+    retry_exceptions: Tuple[Type[Exception], ...] = RETRY_EXCEPTIONS,
+    timeout: float = 10.0,
+    deadline: float = RETRY_DEADLINE,
+    **kwargs: Any
+) -> requests.Response:
+    """
+    Send a prepared request with the same retry behavior as post_with_retry()
+
+    Args:
+        session: Session to send the request with
+        prepared: Prepared request (sent as-is on every attempt)
+        **kwargs: Passed through to session.send(); other args as in post_with_retry()
+
+    Returns:
+        The last response received
+    """
+    return _request_with_retry(
+        lambda attempt_timeout: session.send(prepared, timeout=attempt_timeout, **kwargs),
+        f"{prepared.method} {prepared.url}",
+        max_retries, base_delay, jitter, max_delay, retry_statuses, retry_exceptions,
+        timeout, deadline
+    )
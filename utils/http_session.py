@@ -0,0 +1,72 @@
+"""
+HTTP session helper for notification providers
+Pooled keep-alive sessions so repeated sends reuse TCP/TLS connections
+"""
+import logging
+import socket
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+
+logger = logging.getLogger(__name__)
+
+# Enable TCP keepalive so idle pooled connections aren't silently dropped
+# (e.g. by NAT/firewalls) between infrequent notifications
+_KEEPALIVE_SOCKET_OPTIONS = HTTPConnection.default_socket_options + [
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+]
+if hasattr(socket, "TCP_KEEPIDLE"):
+    _KEEPALIVE_SOCKET_OPTIONS.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 30))
+if hasattr(socket, "TCP_KEEPINTVL"):
+    _KEEPALIVE_SOCKET_OPTIONS.append((socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 10))
+
+
+class KeepAliveAdapter(HTTPAdapter):
+    """HTTPAdapter that opens connections with TCP keepalive enabled"""
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["socket_options"] = _KEEPALIVE_SOCKET_OPTIONS
+        super().init_poolmanager(*args, **kwargs)
+
+
+def create_session(pool_connections: int = 4, pool_maxsize: int = 8) -> requests.Session:
+    """
+    Create a requests session with a connection pool
+
+    Args:
+        pool_connections: Number of host connection pools to cache
+        pool_maxsize: Maximum connections kept per host
+
+    Returns:
+        Configured requests.Session
+    """
+    session = requests.Session()
+    adapter = KeepAliveAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=0
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def warm_up(session: requests.Session, url: str):
+    """
+    Open a pooled connection to a host in the background
+
+    Sends a HEAD request from a daemon thread so the first notification
+    doesn't pay for the TCP/TLS handshake. Failures are ignored.
+
+    Args:
+        session: Session (or httpx client) whose pool should hold the connection
+        url: Any URL on the target host
+    """
+    def _head():
+        try:
+            session.head(url, timeout=5)
+        except Exception as e:
+            logger.debug("Connection warm-up to %s failed: %s", url, e)
+
+    threading.Thread(target=_head, name="http-warm-up", daemon=True).start()